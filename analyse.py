@@ -0,0 +1,153 @@
+"""Quoridor - module analyse
+
+Analyse des plus courts chemins pour la génération des murs candidats.
+
+Pour chaque joueur, une carte des distances à sa rangée but définit le graphe orienté
+acyclique (DAG) de tous ses plus courts chemins. Le nombre de plus courts chemins qui
+empruntent chaque arête s'obtient en un passage; un mur n'allonge le chemin d'un joueur
+que s'il coupe la totalité de ce flux, et seul ce cas demande un nouveau parcours.
+"""
+from collections import deque
+
+from ponts import aretes_mur
+
+
+def distances_but(cases, rangee_but, exclues=()):
+    """
+    Calcule la distance de chaque case à la rangée but par parcours en largeur.
+
+    :param cases: le graphe des cases produit par ponts.construire_cases.
+    :param rangee_but: la coordonnée y de la rangée à atteindre.
+    :param exclues: un ensemble d'arêtes frozenset({case1, case2}) à ignorer.
+    :returns: un dictionnaire case -> distance, limité aux cases qui atteignent le but.
+    """
+    distances = {case: 0 for case in cases if case[1] == rangee_but}
+    file = deque(distances)
+
+    while file:
+        case = file.popleft()
+        for voisine in cases[case]:
+            if voisine not in distances and frozenset((case, voisine)) not in exclues:
+                distances[voisine] = distances[case] + 1
+                file.append(voisine)
+
+    return distances
+
+
+def emplacements_libres(murs_h, murs_v, taille):
+    """
+    Énumère les emplacements de murs qui ne chevauchent aucun mur existant.
+
+    :returns: un générateur de tuples (orientation, (x, y)).
+    """
+    ensemble_h = {tuple(mur) for mur in murs_h}
+    ensemble_v = {tuple(mur) for mur in murs_v}
+
+    for x in range(1, taille):
+        for y in range(2, taille + 1):
+            if not ({(x - 1, y), (x, y), (x + 1, y)} & ensemble_h) and \
+                    (x + 1, y - 1) not in ensemble_v:
+                yield "horizontal", (x, y)
+
+    for x in range(2, taille + 1):
+        for y in range(1, taille):
+            if not ({(x, y - 1), (x, y), (x, y + 1)} & ensemble_v) and \
+                    (x - 1, y + 1) not in ensemble_h:
+                yield "vertical", (x, y)
+
+
+class AnalyseChemins:
+    """DAG des plus courts chemins d'une case vers une rangée but"""
+
+    def __init__(self, cases, depart, rangee_but):
+        """
+        :param cases: le graphe des cases produit par ponts.construire_cases.
+        :param depart: la case (x, y) du joueur.
+        :param rangee_but: la coordonnée y de la rangée que le joueur doit atteindre.
+        """
+        self.cases = cases
+        self.depart = depart
+        self.rangee_but = rangee_but
+        self.distances = distances_but(cases, rangee_but)
+        self.longueur = self.distances.get(depart)
+        self.flux = {}  # frozenset({case1, case2}) -> nombre de plus courts chemins
+        self.total = 0
+
+        if self.longueur is None:
+            return
+
+        # nombre de plus courts chemins de chaque case jusqu'au but (ordre du parcours en
+        # largeur, donc par distance croissante)
+        vers_but = {}
+        for case, distance in self.distances.items():
+            vers_but[case] = 1 if distance == 0 else sum(
+                vers_but[voisine] for voisine in self._suivantes(case))
+
+        # nombre de plus courts chemins du départ jusqu'à chaque case, couche par couche
+        depuis_depart = {depart: 1}
+        couche = [depart]
+        while couche:
+            prochaine = {}
+            for case in couche:
+                for voisine in self._suivantes(case):
+                    self.flux[frozenset((case, voisine))] = \
+                        depuis_depart[case] * vers_but[voisine]
+                    prochaine[voisine] = prochaine.get(voisine, 0) + depuis_depart[case]
+            depuis_depart.update(prochaine)
+            couche = list(prochaine)
+
+        self.total = vers_but[depart]
+
+    def _suivantes(self, case):
+        distance = self.distances[case] - 1
+        return [voisine for voisine in self.cases[case]
+                if self.distances.get(voisine) == distance and distance >= 0]
+
+    def allongement(self, aretes):
+        """
+        Calcule de combien le retrait des arêtes spécifiées allonge le plus court chemin.
+
+        :param aretes: un itérable d'arêtes (case1, case2), p.ex. celles d'un mur.
+        :returns: l'allongement (0 si un plus court chemin subsiste), ou None si le joueur
+        n'atteindrait plus le but.
+        """
+        if self.longueur is None:
+            return None
+
+        cles = {frozenset(arete) for arete in aretes}
+        if sum(self.flux.get(cle, 0) for cle in cles) < self.total:
+            return 0
+
+        longueur = distances_but(self.cases, self.rangee_but, cles).get(self.depart)
+        return None if longueur is None else longueur - self.longueur
+
+
+def classer_murs(index_ponts, positions, murs_h, murs_v, joueur, k):
+    """
+    Classe les murs que le joueur peut placer selon le gain en longueur de chemin, c.-à-d.
+    l'allongement du plus court chemin de l'adversaire moins celui du sien.
+
+    :param index_ponts: le tuple (index du joueur 1, index du joueur 2) d'objets IndexPonts.
+    :param positions: les positions (x, y) des deux joueurs.
+    :param murs_h: les positions (x, y) des murs horizontaux placés.
+    :param murs_v: les positions (x, y) des murs verticaux placés.
+    :param joueur: le numéro du joueur (1 ou 2).
+    :param k: le nombre maximal de murs retournés.
+    :returns: une liste d'au plus k tuples (gain, orientation, (x, y)), du meilleur au pire.
+    """
+    cases = index_ponts[0].cases
+    taille = index_ponts[0].rangee_but
+    analyses = [AnalyseChemins(cases, tuple(position), ponts.rangee_but)
+                for position, ponts in zip(positions, index_ponts)]
+    analyse_joueur, analyse_adversaire = analyses[joueur-1], analyses[2-joueur]
+
+    candidats = []
+    for orientation, position in emplacements_libres(murs_h, murs_v, taille):
+        aretes = aretes_mur(position, orientation)
+        if any(ponts.coupe(tuple(pos), aretes) for ponts, pos in zip(index_ponts, positions)):
+            continue
+        gain = analyse_adversaire.allongement(aretes) - analyse_joueur.allongement(aretes)
+        candidats.append((-gain, orientation, position))
+
+    candidats.sort()
+    return [(-gain, orientation, position) for gain, orientation, position in candidats[:k]]
@@ -0,0 +1,65 @@
+"""Quoridor - banc d'essai du temps de démarrage
+
+Mesure le coût de démarrage de `python main.py -l` (sans l'appel réseau) et le temps
+de création d'un processus ouvrier du moteur (contexte 'spawn') qui charge les règles.
+"""
+import multiprocessing
+import statistics
+import subprocess
+import sys
+import time
+
+NB_ESSAIS = 10
+
+# démarrage de `main.py -l IDUL` jusqu'au moment où la requête réseau serait émise
+CODE_LISTER = """
+import sys
+sys.argv = ["main.py", "-l", "idul"]
+import main
+main.analyser_commande()
+try:
+    import api
+except ImportError:
+    pass
+"""
+
+
+def _ouvrier():
+    """Cible du processus ouvrier: charger les règles du jeu et construire un damier."""
+    from quoridor import Quoridor  # pylint: disable=import-outside-toplevel
+    Quoridor([{"nom": "j1", "murs": 10, "pos": (5, 1)},
+              {"nom": "j2", "murs": 10, "pos": (5, 9)}])
+
+
+def mesurer_sous_processus(code):
+    """Retourne la durée médiane (s) d'un interpréteur exécutant le code spécifié."""
+    durees = []
+    for _ in range(NB_ESSAIS):
+        debut = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        durees.append(time.perf_counter() - debut)
+    return statistics.median(durees)
+
+
+def mesurer_ouvrier():
+    """Retourne la durée médiane (s) du lancement et de la fin d'un ouvrier du moteur."""
+    contexte = multiprocessing.get_context("spawn")
+    durees = []
+    for _ in range(NB_ESSAIS):
+        debut = time.perf_counter()
+        processus = contexte.Process(target=_ouvrier)
+        processus.start()
+        processus.join()
+        durees.append(time.perf_counter() - debut)
+    return statistics.median(durees)
+
+
+def main():
+    """Affiche les durées médianes de démarrage."""
+    print(f"interpréteur nu        : {mesurer_sous_processus('pass') * 1000:8.1f} ms")
+    print(f"python main.py -l      : {mesurer_sous_processus(CODE_LISTER) * 1000:8.1f} ms")
+    print(f"ouvrier du moteur      : {mesurer_ouvrier() * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
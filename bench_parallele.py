@@ -0,0 +1,46 @@
+"""Quoridor - banc d'essai de la recherche parallèle
+
+Mesure le temps de choix d'un coup en fonction du nombre de processus, pour une position
+de milieu de partie et une profondeur fixe, et vérifie que le coup choisi ne varie pas.
+"""
+import os
+import time
+
+import moteur
+from quoridor import Quoridor
+
+PROFONDEUR = 3
+NB_COUPS_OUVERTURE = 8
+
+
+def position_test():
+    """Retourne une partie de milieu de partie, jouée par le joueur glouton."""
+    partie = Quoridor(["j1", "j2"])
+    for i in range(NB_COUPS_OUVERTURE):
+        partie.jouer_coup(1 + i % 2)
+    return partie
+
+
+def main():
+    """Affiche le temps et l'accélération de la recherche selon le nombre de processus."""
+    partie = position_test()
+    nb_coeurs = os.cpu_count() or 1
+    references = None
+
+    print(f"profondeur {PROFONDEUR}, {nb_coeurs} coeur(s)")
+    print(f"{'processus':>9} {'durée':>10} {'accélération':>13}  coup")
+    for nb_processus in sorted({1, 2, 4, 8, nb_coeurs}):
+        moteur.choisir_coup(partie, 1, 1, nb_processus)  # démarrage des ouvriers
+
+        debut = time.perf_counter()
+        coup = moteur.choisir_coup(partie, 1, PROFONDEUR, nb_processus)
+        duree = time.perf_counter() - debut
+
+        if references is None:
+            references = duree, coup
+        assert coup == references[1], "le coup choisi dépend du nombre de processus"
+        print(f"{nb_processus:>9} {duree:>8.2f} s {references[0] / duree:>12.2f}x  {coup}")
+
+
+if __name__ == "__main__":
+    main()
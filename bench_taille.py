@@ -0,0 +1,84 @@
+"""Quoridor - banc d'essai selon la taille du damier
+
+Mesure, pour des damiers de 5x5 à 25x25, le coût des requêtes de chemin, de la validation
+des murs et de la génération des coups, ainsi que ce coût rapporté au nombre de cases.
+"""
+import random
+import time
+
+from graphe import plus_court_chemin
+from quoridor import Quoridor, QuoridorError, construire_graphe, nb_murs_par_joueur
+
+TAILLES = (5, 9, 13, 17, 21, 25)
+NB_ESSAIS = 20
+
+
+def partie_murée(taille, graine=0):
+    """Retourne une partie où environ la moitié des murs disponibles ont été placés."""
+    partie = Quoridor(["j1", "j2"], taille=taille)
+    generateur = random.Random(graine)
+    a_placer = nb_murs_par_joueur(taille)
+
+    while a_placer:
+        orientation = generateur.choice(("horizontal", "vertical"))
+        if orientation == "horizontal":
+            position = (generateur.randint(1, taille - 1), generateur.randint(2, taille))
+        else:
+            position = (generateur.randint(2, taille), generateur.randint(1, taille - 1))
+        try:
+            partie.placer_mur(1 + a_placer % 2, position, orientation)
+            a_placer -= 1
+        except QuoridorError:
+            pass
+
+    return partie
+
+
+def chronométrer(fonction):
+    """Retourne la durée moyenne (s) d'un appel à la fonction."""
+    debut = time.perf_counter()
+    for _ in range(NB_ESSAIS):
+        fonction()
+    return (time.perf_counter() - debut) / NB_ESSAIS
+
+
+def mesurer(taille):
+    """Retourne les durées (chemin, validation de mur, génération de coups) pour la taille."""
+    partie = partie_murée(taille)
+    murs = partie.etat["murs"]
+    pos_joueurs = [tuple(joueur["pos"]) for joueur in partie.etat["joueurs"]]
+
+    def chemin():
+        graphe = construire_graphe(pos_joueurs, murs["horizontaux"], murs["verticaux"], taille)
+        plus_court_chemin(graphe, pos_joueurs[0], "B1")
+
+    def validation():
+        partie._ponts = None  # pylint: disable=protected-access
+        for x in range(1, taille):
+            try:
+                Quoridor.valider_murs(murs["horizontaux"] + [(x, taille // 2)],
+                                      murs["verticaux"], taille)
+            except QuoridorError:
+                continue
+            partie.mur_emprisonne((x, taille // 2), "horizontal")
+
+    def coups():
+        graphe = construire_graphe(pos_joueurs, murs["horizontaux"], murs["verticaux"], taille)
+        graphe.successors(pos_joueurs[0])
+
+    return chronométrer(chemin), chronométrer(validation), chronométrer(coups)
+
+
+def main():
+    """Affiche les durées par taille de damier, en absolu et par case."""
+    print(f"{'taille':>6} {'cases':>6} {'chemin':>12} {'murs':>12} {'coups':>12}  (µs/case)")
+    for taille in TAILLES:
+        nb_cases = taille * taille
+        durees = mesurer(taille)
+        print(f"{taille:>6} {nb_cases:>6} " +
+              " ".join(f"{duree * 1e3:9.3f} ms" for duree in durees) +
+              "  " + " / ".join(f"{duree * 1e6 / nb_cases:.2f}" for duree in durees))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Quoridor - module graphe"""
+from collections import deque
+
+
+class Graphe:
+    """
+    Graphe orienté minimal offrant le sous-ensemble de l'interface de networkx.DiGraph
+    utilisé par les règles du jeu, sans dépendance externe.
+    """
+
+    def __init__(self):
+        self.succ = {}
+
+    def __contains__(self, noeud):
+        return noeud in self.succ
+
+    def __iter__(self):
+        return iter(self.succ)
+
+    def __len__(self):
+        return len(self.succ)
+
+    def add_edge(self, depart, arrivee):
+        """Ajoute l'arc depart -> arrivee (et les noeuds au besoin)."""
+        self.succ.setdefault(depart, {})[arrivee] = None
+        self.succ.setdefault(arrivee, {})
+
+    def remove_edge(self, depart, arrivee):
+        """Retire l'arc depart -> arrivee, ou soulève KeyError s'il n'existe pas."""
+        del self.succ[depart][arrivee]
+
+    def has_edge(self, depart, arrivee):
+        """Vérifie si l'arc depart -> arrivee existe."""
+        return arrivee in self.succ.get(depart, ())
+
+    def successors(self, noeud):
+        """Retourne la liste des successeurs du noeud."""
+        return list(self.succ[noeud])
+
+    def en_networkx(self):
+        """Retourne une copie du graphe en networkx.DiGraph (import à la demande)."""
+        import networkx as nx  # pylint: disable=import-outside-toplevel
+
+        graphe = nx.DiGraph()
+        for depart, arrivees in self.succ.items():
+            graphe.add_node(depart)
+            for arrivee in arrivees:
+                graphe.add_edge(depart, arrivee)
+        return graphe
+
+
+def plus_court_chemin(graphe, source, cible):
+    """
+    Retourne le plus court chemin (liste de noeuds) de source à cible par parcours en largeur.
+
+    :raises KeyError: si aucun chemin n'existe.
+    """
+    parents = {source: None}
+    file = deque([source])
+
+    while file:
+        noeud = file.popleft()
+        if noeud == cible:
+            chemin = []
+            while noeud is not None:
+                chemin.append(noeud)
+                noeud = parents[noeud]
+            return chemin[::-1]
+
+        for voisin in graphe.succ[noeud]:
+            if voisin not in parents:
+                parents[voisin] = noeud
+                file.append(voisin)
+
+    raise KeyError(f"Aucun chemin entre {source} et {cible}")
+
+
+def a_chemin(graphe, source, cible):
+    """Vérifie s'il existe un chemin de source à cible."""
+    try:
+        plus_court_chemin(graphe, source, cible)
+    except KeyError:
+        return False
+    return True
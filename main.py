@@ -1,13 +1,10 @@
 """Quoridor - module main"""
-# pylint: disable=no-member
+# pylint: disable=no-member,import-outside-toplevel
+# Les modules lourds (requests via api, turtle/Tk, règles du jeu) sont importés à la
+# demande selon le mode afin que les invocations courtes (-l, aide) démarrent rapidement.
 import argparse
 import re
 import time
-import turtle
-
-import api
-from quoridor import Quoridor
-from quoridorx import QuoridorX
 
 
 def analyser_commande():
@@ -23,6 +20,15 @@ def analyser_commande():
     parser.add_argument("-x", dest="mode_graphique", action="store_true",
                         help="Jouer contre le serveur avec affichage graphique")
 
+    parser.add_argument("--profondeur", type=int, default=0,
+                        help="Profondeur de la recherche en mode automatique (0: jeu glouton)")
+
+    parser.add_argument("-j", dest="processus", type=int, default=None,
+                        help="Nombre de processus de la recherche (défaut: nombre de coeurs)")
+
+    parser.add_argument("--duree", type=float, default=1.0,
+                        help="Temps alloué à la recherche à chaque tour, en secondes")
+
     parser.add_argument("idul", help="IDUL du joueur")  # , nargs='?', default="phcas16")
 
     return parser.parse_args()
@@ -30,6 +36,8 @@ def analyser_commande():
 
 def jouer_coup(args, q, id_partie):
     """Boucle de saisie."""
+    import api
+
     if args.mode_auto:
         return api.jouer_coup(id_partie, q.type_coup.upper(), q.pos_coup)
 
@@ -39,6 +47,7 @@ def jouer_coup(args, q, id_partie):
 
     while not capture:
         if args.mode_graphique:
+            import turtle
             entree = turtle.textinput(titre, question)
             if entree is None:  # bouton Cancel ou X
                 turtle.mainloop()  # pause sur damier
@@ -72,20 +81,25 @@ def main():
     """Boucle principale."""
     args = analyser_commande()
 
+    import api
+
     if args.lister:
         for partie in api.lister_parties(args.idul):
             print(partie["id"])
         return
 
+    if args.mode_graphique:
+        import turtle
+        from quoridorx import QuoridorX as Jeu
+    else:
+        from quoridor import Quoridor as Jeu
+
     id_partie, partie = api.débuter_partie(args.idul)
     gagnant = False
     q = None
 
     while not gagnant:
-        if args.mode_graphique:
-            q = QuoridorX(partie["joueurs"], partie["murs"])
-        else:
-            q = Quoridor(partie["joueurs"], partie["murs"])
+        q = Jeu(partie["joueurs"], partie["murs"])
 
         gagnant = q.partie_terminée()
         if gagnant:
@@ -93,7 +107,7 @@ def main():
 
         if args.mode_auto:
             time.sleep(0.25)
-            q.jouer_coup(1)
+            q.jouer_coup(1, args.profondeur, args.processus, args.duree)
 
         if args.mode_graphique:
             q.afficher()
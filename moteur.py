@@ -0,0 +1,221 @@
+"""Quoridor - module moteur
+
+Recherche alpha-bêta du meilleur coup, avec répartition des coups racine sur plusieurs
+processus. Les ouvriers reçoivent un état compact (tuples de positions et de murs) plutôt
+que le dictionnaire 'etat' d'une partie, et reconstruisent eux-mêmes le damier.
+
+Chaque coup racine est évalué avec une fenêtre complète, indépendamment des autres: le
+score obtenu ne dépend donc ni du nombre de processus ni de l'ordre d'exécution, et le
+coup choisi est le même pour une profondeur donnée (à égalité, le premier coup racine).
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from analyse import classer_murs, distances_but
+from ponts import IndexPonts, construire_cases
+
+GAGNE = 10000
+
+_executeurs = {}
+
+
+class TempsEcoule(Exception):
+    """Exception levée lorsque l'échéance de la recherche est dépassée"""
+
+
+def encoder(partie, joueur):
+    """
+    Produit l'état compact d'une partie, avec le joueur spécifié au trait.
+
+    :param partie: une instance de Quoridor.
+    :param joueur: le numéro du joueur au trait (1 ou 2).
+    :returns: le tuple (taille, trait, positions, murs restants, murs h, murs v).
+    """
+    joueurs = partie.etat["joueurs"]
+    return (partie.taille,
+            joueur,
+            tuple(tuple(j["pos"]) for j in joueurs),
+            tuple(j["murs"] for j in joueurs),
+            tuple(sorted(tuple(mur) for mur in partie.etat["murs"]["horizontaux"])),
+            tuple(sorted(tuple(mur) for mur in partie.etat["murs"]["verticaux"])))
+
+
+@lru_cache(maxsize=4096)
+def _damier(taille, murs_h, murs_v):
+    """Retourne l'index des ponts des deux joueurs pour une disposition de murs."""
+    cases = construire_cases(murs_h, murs_v, taille)
+    return IndexPonts(cases, taille), IndexPonts(cases, 1)
+
+
+def _gagnant(etat):
+    """Retourne le numéro du joueur qui a atteint sa rangée but, ou 0."""
+    taille, _, positions, _, _, _ = etat
+    if positions[0][1] == taille:
+        return 1
+    if positions[1][1] == 1:
+        return 2
+    return 0
+
+
+def deplacements(cases, position, autre):
+    """
+    Énumère les cases accessibles au jeton, en tenant compte du saut par-dessus l'autre.
+
+    :param cases: le graphe des cases produit par ponts.construire_cases.
+    :param position: la position (x, y) du jeton à déplacer.
+    :param autre: la position (x, y) du jeton adverse.
+    """
+    for voisine in cases[position]:
+        if voisine != autre:
+            yield voisine
+            continue
+
+        saut = 2*voisine[0]-position[0], 2*voisine[1]-position[1]
+        if saut in cases[voisine]:
+            yield saut  # saut en ligne droite
+        else:
+            yield from (case for case in cases[voisine] if case != position)  # en diagonale
+
+
+def coups(etat, nb_murs):
+    """
+    Produit les coups du joueur au trait: ses déplacements, du plus prometteur au moins
+    prometteur, puis les nb_murs meilleurs murs selon l'analyse des plus courts chemins.
+
+    :returns: une liste de tuples (type de coup, (x, y)) avec le type 'D', 'MH' ou 'MV'.
+    """
+    taille, trait, positions, murs_restants, murs_h, murs_v = etat
+    index_ponts = _damier(taille, murs_h, murs_v)
+    distances = distances_but(index_ponts[trait-1].cases, index_ponts[trait-1].rangee_but)
+
+    liste = [("D", case) for case in sorted(
+        deplacements(index_ponts[0].cases, positions[trait-1], positions[2-trait]),
+        key=lambda case: (distances.get(case, GAGNE), case))]
+
+    if murs_restants[trait-1] > 0 and nb_murs > 0:
+        liste.extend(("MH" if orientation == "horizontal" else "MV", position)
+                     for _, orientation, position in classer_murs(
+                         index_ponts, positions, murs_h, murs_v, trait, nb_murs))
+
+    return liste
+
+
+def jouer(etat, coup):
+    """Retourne l'état compact qui suit le coup du joueur au trait."""
+    taille, trait, positions, murs_restants, murs_h, murs_v = etat
+    type_coup, position = coup
+
+    if type_coup == "D":
+        positions = tuple(position if i == trait-1 else pos for i, pos in enumerate(positions))
+    else:
+        murs_restants = tuple(n - 1 if i == trait-1 else n for i, n in enumerate(murs_restants))
+        if type_coup == "MH":
+            murs_h = tuple(sorted(murs_h + (position,)))
+        else:
+            murs_v = tuple(sorted(murs_v + (position,)))
+
+    return taille, 3 - trait, positions, murs_restants, murs_h, murs_v
+
+
+def evaluer(etat):
+    """Évalue l'état du point de vue du joueur au trait (différence de distances au but)."""
+    taille, trait, positions, murs_restants, murs_h, murs_v = etat
+    index_ponts = _damier(taille, murs_h, murs_v)
+    distances = [distances_but(ponts.cases, ponts.rangee_but)[position]
+                 for ponts, position in zip(index_ponts, positions)]
+
+    return 2 * (distances[2-trait] - distances[trait-1]) + \
+        murs_restants[trait-1] - murs_restants[2-trait]
+
+
+def negamax(etat, profondeur, alpha, beta, echeance, nb_murs):
+    """
+    Recherche alpha-bêta à profondeur fixe, du point de vue du joueur au trait.
+
+    :raises TempsEcoule: si l'échéance (time.time()) est dépassée.
+    """
+    if echeance is not None and time.time() > echeance:
+        raise TempsEcoule()
+
+    gagnant = _gagnant(etat)
+    if gagnant:
+        # le joueur précédent vient de gagner; préférer les victoires rapides
+        return -(GAGNE + profondeur)
+
+    if profondeur == 0:
+        return evaluer(etat)
+
+    meilleur = -GAGNE * 2
+    for coup in coups(etat, nb_murs):
+        score = -negamax(jouer(etat, coup), profondeur - 1, -beta, -alpha, echeance, nb_murs)
+        if score > meilleur:
+            meilleur = score
+        alpha = max(alpha, score)
+        if alpha >= beta:
+            break
+
+    return meilleur
+
+
+def _evaluer_racine(tache):
+    """
+    Évalue un coup racine dans un ouvrier.
+
+    :param tache: le tuple (état compact, coup, profondeur, échéance, nb_murs).
+    :returns: le score du coup, ou None si l'échéance a été atteinte.
+    """
+    etat, coup, profondeur, echeance, nb_murs = tache
+    try:
+        return -negamax(jouer(etat, coup), profondeur - 1, -GAGNE * 2, GAGNE * 2,
+                        echeance, nb_murs)
+    except TempsEcoule:
+        return None
+
+
+def _executeur(nb_processus):
+    """Retourne un bassin de processus réutilisé d'un appel à l'autre."""
+    if nb_processus not in _executeurs:
+        _executeurs[nb_processus] = ProcessPoolExecutor(nb_processus)
+    return _executeurs[nb_processus]
+
+
+def choisir_coup(partie, joueur, profondeur=2, nb_processus=None, duree=None, nb_murs=6):
+    """
+    Choisit le meilleur coup du joueur par approfondissement itératif jusqu'à la
+    profondeur spécifiée, les coups racine étant répartis sur un bassin de processus.
+    Si l'échéance survient pendant une itération, le résultat de la précédente est retenu.
+
+    :param partie: une instance de Quoridor.
+    :param joueur: le numéro du joueur (1 ou 2).
+    :param profondeur: la profondeur maximale de la recherche, en demi-coups.
+    :param nb_processus: le nombre de processus ouvriers (par défaut, le nombre de coeurs);
+    avec 1, la recherche se fait dans le processus courant.
+    :param duree: le temps alloué à la recherche en secondes, ou None pour aucune limite.
+    :param nb_murs: le nombre de murs candidats considérés à chaque noeud.
+    :returns: le tuple (type de coup, (x, y)) du coup choisi.
+    """
+    etat = encoder(partie, joueur)
+    echeance = None if duree is None else time.time() + duree
+    racine = coups(etat, nb_murs)
+    nb_processus = nb_processus or os.cpu_count() or 1
+    meilleur = racine[0]
+
+    for niveau in range(1, profondeur + 1):
+        taches = [(etat, coup, niveau, echeance, nb_murs) for coup in racine]
+
+        if nb_processus == 1:
+            scores = list(map(_evaluer_racine, taches))
+        else:
+            taille_lot = max(1, len(taches) // (4 * nb_processus))
+            scores = list(_executeur(nb_processus).map(_evaluer_racine, taches,
+                                                       chunksize=taille_lot))
+
+        if None in scores:
+            break
+
+        # à égalité, le premier coup racine l'emporte: le choix reste déterministe
+        meilleur = racine[max(range(len(racine)), key=lambda i: (scores[i], -i))]
+
+    return meilleur
@@ -0,0 +1,209 @@
+"""Quoridor - module ponts
+
+Index des arêtes critiques (ponts) du damier pour l'accès d'un joueur à sa rangée but.
+
+Le damier est vu comme un graphe non orienté de cases auquel on ajoute un noeud but relié
+à toutes les cases de la rangée visée. Un arbre de parcours en profondeur est enraciné au
+noeud but et chaque arête reçoit une étiquette: une valeur aléatoire pour les arêtes hors
+arbre, et le OU exclusif des étiquettes des arêtes hors arbre qui la couvrent pour les
+arêtes de l'arbre. Une arête d'étiquette nulle est un pont; deux arêtes de même étiquette
+non nulle forment une paire de coupe. Un mur retire deux arêtes, d'où l'intérêt des paires.
+"""
+import random
+from collections import deque
+
+BUT = "B"
+
+
+def construire_cases(murs_horizontaux, murs_verticaux, taille=9):
+    """
+    Crée le graphe non orienté des cases du damier, sans les pions.
+
+    :param murs_horizontaux: une liste des positions (x,y) des murs horizontaux.
+    :param murs_verticaux: une liste des positions (x,y) des murs verticaux.
+    :param taille: le nombre de rangées (et de colonnes) du damier.
+    :returns: un dictionnaire associant chaque case (x, y) à l'ensemble de ses voisines.
+    """
+    cases = {(x, y): set() for x in range(1, taille + 1) for y in range(1, taille + 1)}
+
+    for (x, y), voisins in cases.items():
+        if x < taille:
+            voisins.add((x+1, y))
+            cases[(x+1, y)].add((x, y))
+        if y < taille:
+            voisins.add((x, y+1))
+            cases[(x, y+1)].add((x, y))
+
+    for arete in (a for mur in murs_horizontaux for a in aretes_mur(mur, "horizontal")):
+        retirer_arete(cases, arete)
+
+    for arete in (a for mur in murs_verticaux for a in aretes_mur(mur, "vertical")):
+        retirer_arete(cases, arete)
+
+    return cases
+
+
+def retirer_arete(cases, arete):
+    """Retire l'arête (case1, case2) du graphe des cases si elle est présente."""
+    case_1, case_2 = arete
+    cases[case_1].discard(case_2)
+    cases[case_2].discard(case_1)
+
+
+def aretes_mur(position, orientation):
+    """
+    Retourne les deux arêtes (case1, case2) coupées par un mur.
+
+    :param position: le tuple (x, y) de la position du mur.
+    :param orientation: l'orientation du mur ('horizontal' ou 'vertical').
+    """
+    x, y = position
+    if orientation == "horizontal":
+        return ((x, y-1), (x, y)), ((x+1, y-1), (x+1, y))
+    return ((x-1, y), (x, y)), ((x-1, y+1), (x, y+1))
+
+
+class IndexPonts:
+    """Index des ponts et des paires de coupe pour l'accès à une rangée but"""
+
+    def __init__(self, cases, rangee_but, graine=0):
+        """
+        :param cases: le graphe des cases produit par construire_cases.
+        :param rangee_but: la coordonnée y de la rangée que le joueur doit atteindre.
+        :param graine: la graine du générateur d'étiquettes (pour un index reproductible).
+        """
+        self.cases = cases
+        self.rangee_but = rangee_but
+        self.parent = {}
+        self.entree = {}
+        self.sortie = {}
+        self.etiquette = {}  # case -> étiquette de l'arête (case, parent[case])
+        self.hors_arbre = {}  # {case1, case2} -> étiquette de l'arête hors arbre
+
+        generateur = random.Random(graine)
+        cumul = {}
+        ordre = []
+        voisins_but = [case for case in cases if case[1] == rangee_but]
+
+        # parcours en profondeur itératif enraciné au noeud but
+        self.parent[BUT] = None
+        self.entree[BUT] = 0
+        pile = [(BUT, iter(voisins_but))]
+        horloge = 1
+
+        while pile:
+            noeud, voisins = pile[-1]
+            for voisin in voisins:
+                if voisin not in self.entree:
+                    self.parent[voisin] = noeud
+                    self.entree[voisin] = horloge
+                    horloge += 1
+                    ordre.append(voisin)
+                    pile.append((voisin, iter(self._voisins(voisin))))
+                    break
+                if voisin != self.parent[noeud] and self.entree[voisin] < self.entree[noeud]:
+                    # arête arrière vers un ancêtre
+                    valeur = generateur.getrandbits(64)
+                    self.hors_arbre[self._cle(noeud, voisin)] = valeur
+                    cumul[noeud] = cumul.get(noeud, 0) ^ valeur
+                    cumul[voisin] = cumul.get(voisin, 0) ^ valeur
+            else:
+                self.sortie[noeud] = horloge
+                pile.pop()
+
+        # étiquettes des arêtes de l'arbre, des feuilles vers la racine
+        for case in reversed(ordre):
+            self.etiquette[case] = self.etiquette.get(case, 0) ^ cumul.get(case, 0)
+            parent = self.parent[case]
+            if parent != BUT:
+                self.etiquette[parent] = self.etiquette.get(parent, 0) ^ self.etiquette[case]
+
+    def _voisins(self, noeud):
+        if noeud[1] == self.rangee_but:
+            return [*self.cases[noeud], BUT]
+        return self.cases[noeud]
+
+    @staticmethod
+    def _cle(noeud_1, noeud_2):
+        return frozenset((noeud_1, noeud_2))
+
+    def atteignable(self, case):
+        """Vérifie si la rangée but est atteignable depuis la case."""
+        return case in self.entree
+
+    def _dans_sous_arbre(self, case, racine):
+        return self.entree[racine] <= self.entree[case] < self.sortie[racine]
+
+    def _decrire(self, arete):
+        """Retourne (étiquette, case enfant ou None) de l'arête, ou None si hors index."""
+        case_1, case_2 = arete
+        if self.parent.get(case_1) == case_2:
+            return self.etiquette[case_1], case_1
+        if self.parent.get(case_2) == case_1:
+            return self.etiquette[case_2], case_2
+        cle = self._cle(case_1, case_2)
+        if cle in self.hors_arbre:
+            return self.hors_arbre[cle], None
+        return None
+
+    def est_pont(self, arete):
+        """Vérifie si l'arête (case1, case2) est un pont vers la rangée but."""
+        description = self._decrire(arete)
+        return description is not None and description[1] is not None and description[0] == 0
+
+    def coupe(self, case, aretes):
+        """
+        Vérifie si retirer les arêtes spécifiées isolerait la case de la rangée but.
+
+        :param case: la case (x, y) du joueur.
+        :param aretes: un itérable d'au plus deux arêtes (case1, case2), p.ex. celles d'un mur.
+        :returns: True si la case n'atteindrait plus la rangée but.
+        """
+        if not self.atteignable(case):
+            return True
+
+        descriptions = [d for d in map(self._decrire, aretes) if d is not None]
+
+        # un pont dont le sous-arbre contient la case la sépare du but
+        for etiquette, enfant in descriptions:
+            if etiquette == 0 and enfant is not None and self._dans_sous_arbre(case, enfant):
+                return True
+
+        if len(descriptions) < 2:
+            return False
+
+        (etiquette_1, enfant_1), (etiquette_2, enfant_2) = descriptions
+        if etiquette_1 != etiquette_2 or etiquette_1 == 0:
+            return False
+
+        # paire de coupe: déterminer le côté de la case
+        if enfant_1 is None or enfant_2 is None:
+            enfant = enfant_1 if enfant_2 is None else enfant_2
+            if enfant is None or not self._dans_sous_arbre(case, enfant):
+                return False
+        else:
+            if self._dans_sous_arbre(enfant_1, enfant_2):
+                enfant_1, enfant_2 = enfant_2, enfant_1
+            if not self._dans_sous_arbre(case, enfant_1) or \
+                    self._dans_sous_arbre(case, enfant_2):
+                return False
+
+        # égalité d'étiquettes: confirmer pour écarter une collision improbable
+        return not self._chemin_sans(case, aretes)
+
+    def _chemin_sans(self, case, aretes):
+        """Vérifie par parcours en largeur si la case atteint le but sans les arêtes."""
+        exclues = {self._cle(*arete) for arete in aretes}
+        vues = {case}
+        file = deque([case])
+
+        while file:
+            courante = file.popleft()
+            if courante[1] == self.rangee_but:
+                return True
+            for voisine in self.cases[courante]:
+                if voisine not in vues and self._cle(courante, voisine) not in exclues:
+                    vues.add(voisine)
+                    file.append(voisine)
+
+        return False
@@ -1,31 +1,41 @@
 """Quoridor - module quoridor"""
 from copy import deepcopy
-import networkx as nx
+from analyse import classer_murs
+from graphe import Graphe, plus_court_chemin
+from ponts import IndexPonts, aretes_mur, construire_cases
 
+TAILLE_DEFAUT = 9
 
-def construire_graphe(joueurs, murs_horizontaux, murs_verticaux):
+
+def nb_murs_par_joueur(taille):
+    """Retourne le nombre de murs initial d'un joueur, proportionnel à la taille du damier."""
+    return taille + 1
+
+
+def construire_graphe(joueurs, murs_horizontaux, murs_verticaux, taille=TAILLE_DEFAUT):
     """
     Crée le graphe des déplacements admissibles pour les joueurs.
 
     :param joueurs: une liste des positions (x,y) des joueurs.
     :param murs_horizontaux: une liste des positions (x,y) des murs horizontaux.
     :param murs_verticaux: une liste des positions (x,y) des murs verticaux.
-    :returns: le graphe bidirectionnel (en networkX) des déplacements admissibles.
+    :param taille: le nombre de rangées (et de colonnes) du damier.
+    :returns: le graphe bidirectionnel (Graphe) des déplacements admissibles.
     """
-    graphe = nx.DiGraph()
+    graphe = Graphe()
 
     # pour chaque colonne du damier
-    for x in range(1, 10):
+    for x in range(1, taille + 1):
         # pour chaque ligne du damier
-        for y in range(1, 10):
+        for y in range(1, taille + 1):
             # ajouter les arcs de tous les déplacements possibles pour cette tuile
             if x > 1:
                 graphe.add_edge((x, y), (x-1, y))
-            if x < 9:
+            if x < taille:
                 graphe.add_edge((x, y), (x+1, y))
             if y > 1:
                 graphe.add_edge((x, y), (x, y-1))
-            if y < 9:
+            if y < taille:
                 graphe.add_edge((x, y), (x, y+1))
 
     # retirer tous les arcs qui croisent les murs horizontaux
@@ -72,8 +82,8 @@ def construire_graphe(joueurs, murs_horizontaux, murs_verticaux):
         ajouter_lien_sauteur(j2, j1)
 
     # ajouter les destinations finales des joueurs
-    for x in range(1, 10):
-        graphe.add_edge((x, 9), 'B1')
+    for x in range(1, taille + 1):
+        graphe.add_edge((x, taille), 'B1')
         graphe.add_edge((x, 1), 'B2')
 
     return graphe
@@ -87,47 +97,53 @@ class Quoridor:
     """Classe implémentant le jeu Quoridor"""
 
     @staticmethod
-    def pos_joueur_valide(pos_joueur):
+    def pos_joueur_valide(pos_joueur, taille=TAILLE_DEFAUT):
         """Vérifie si la position pos_joueur est valide"""
         return isinstance(pos_joueur, (list, tuple)) and len(pos_joueur) == 2 and \
-            all(isinstance(x, int) and 1 <= x <= 9 for x in pos_joueur)
+            all(isinstance(x, int) and 1 <= x <= taille for x in pos_joueur)
 
     @staticmethod
-    def pos_mur_h_valide(mur_h):
+    def pos_mur_h_valide(mur_h, taille=TAILLE_DEFAUT):
         """Vérifie si la position mur_h est valide"""
         return isinstance(mur_h, (list, tuple)) and len(mur_h) == 2 and \
-            all(isinstance(x, int) for x in mur_h) and 1 <= mur_h[0] <= 8 and 2 <= mur_h[1] <= 9
+            all(isinstance(x, int) for x in mur_h) and \
+            1 <= mur_h[0] <= taille - 1 and 2 <= mur_h[1] <= taille
 
     @staticmethod
-    def pos_mur_v_valide(mur_v):
+    def pos_mur_v_valide(mur_v, taille=TAILLE_DEFAUT):
         """Vérifie si la position mur_v est valide"""
         return isinstance(mur_v, (list, tuple)) and len(mur_v) == 2 and \
-            all(isinstance(x, int) for x in mur_v) and 2 <= mur_v[0] <= 9 and 1 <= mur_v[1] <= 8
+            all(isinstance(x, int) for x in mur_v) and \
+            2 <= mur_v[0] <= taille and 1 <= mur_v[1] <= taille - 1
 
     @classmethod
-    def valider_murs(cls, murs_h, murs_v):
-        """Vérifie si tous les murs sont valides"""
-        for i, mur_h in enumerate(murs_h):
-            if not cls.pos_mur_h_valide(mur_h):
+    def valider_murs(cls, murs_h, murs_v, taille=TAILLE_DEFAUT):
+        """Vérifie si tous les murs sont valides (en temps linéaire en nombre de murs)"""
+        for mur_h in murs_h:
+            if not cls.pos_mur_h_valide(mur_h, taille):
                 raise QuoridorError("La position d'un des murs horizontaux est invalide")
 
-            if any(mur_h[1] == mur_h2[1] and mur_h[0] - 1 <= mur_h2[0] <= mur_h[0] + 1
-                   for j, mur_h2 in enumerate(murs_h) if i != j):
-                raise QuoridorError("Deux des murs horizontaux se chevauchent")
+        ensemble_h = {tuple(mur_h) for mur_h in murs_h}
 
-        for i, mur_v in enumerate(murs_v):
-            if not cls.pos_mur_v_valide(mur_v):
+        if len(ensemble_h) != len(murs_h) or \
+                any((x + 1, y) in ensemble_h for x, y in ensemble_h):
+            raise QuoridorError("Deux des murs horizontaux se chevauchent")
+
+        for mur_v in murs_v:
+            if not cls.pos_mur_v_valide(mur_v, taille):
                 raise QuoridorError("La position d'un des murs verticaux est invalide")
 
-            if any(mur_v[0] == mur_v2[0] and mur_v[1] - 1 <= mur_v2[1] <= mur_v[1] + 1
-                   for j, mur_v2 in enumerate(murs_v) if i != j):
-                raise QuoridorError("Deux des murs verticaux se chevauchent")
+        ensemble_v = {tuple(mur_v) for mur_v in murs_v}
+
+        if len(ensemble_v) != len(murs_v) or \
+                any((x, y + 1) in ensemble_v for x, y in ensemble_v):
+            raise QuoridorError("Deux des murs verticaux se chevauchent")
 
-            if any(tuple(mur_h) == (mur_v[0] - 1, mur_v[1] + 1) for mur_h in murs_h):
-                raise QuoridorError("Un des murs horizontaux et un des murs verticaux se "
-                                    "chevauchent")
+        if any((x - 1, y + 1) in ensemble_h for x, y in ensemble_v):
+            raise QuoridorError("Un des murs horizontaux et un des murs verticaux se "
+                                "chevauchent")
 
-    def __init__(self, joueurs, murs=None):
+    def __init__(self, joueurs, murs=None, taille=TAILLE_DEFAUT):
         """
         Initialiser une partie de Quoridor avec les joueurs et les murs spécifiés,
         en s'assurant de faire une copie profonde de tout ce qui a besoin d'être copié.
@@ -136,22 +152,33 @@ class Quoridor:
         débute la partie. Un joueur est soit une chaîne de caractères soit un dictionnaire.
         Dans le cas d'une chaîne, il s'agit du nom du joueur. Selon le rang du joueur dans
         l'itérable, sa position est soit (5,1) soit (5,9), et chaque joueur peut initialement
-        placer 10 murs. Dans le cas où l'argument est un dictionnaire, celui-ci doit contenir
-        une clé 'nom' identifiant le joueur, une clé 'murs' spécifiant le nombre de murs qu'il
-        peut encore placer, et une clé 'pos' qui spécifie sa position (x, y) actuelle.
+        placer 10 murs (sur un damier de 9x9, voir l'argument 'taille'). Dans le cas où
+        l'argument est un dictionnaire, celui-ci doit contenir une clé 'nom' identifiant
+        le joueur, une clé 'murs' spécifiant le nombre de murs qu'il peut encore placer, et
+        une clé 'pos' qui spécifie sa position (x, y) actuelle.
 
         :param murs: un dictionnaire contenant une clé 'horizontaux' associée à la liste des
         positions (x, y) des murs horizontaux, et une clé 'verticaux' associée à la liste des
         positions (x, y) des murs verticaux. Par défaut, il n'y a aucun mur placé sur le jeu.
 
+        :param taille: le nombre de rangées (et de colonnes) du damier, 9 par défaut. Les
+        positions initiales sont alors centrées sur les rangées 1 et 'taille', et chaque joueur
+        dispose de taille+1 murs.
+
+        :raises QuoridorError: si la taille du damier est invalide.
         :raises QuoridorError: si l'argument 'joueurs' n'est pas itérable.
         :raises QuoridorError: si l'itérable de joueurs en contient plus de deux.
-        :raises QuoridorError: si le nombre de murs qu'un joueur peut placer est >10, ou négatif.
+        :raises QuoridorError: si le nombre de murs qu'un joueur peut placer est >10 (pour un
+        damier de 9x9), ou négatif.
         :raises QuoridorError: si la position d'un joueur est invalide.
         :raises QuoridorError: si l'argument 'murs' n'est pas un dictionnaire lorsque présent.
-        :raises QuoridorError: si le total des murs placés et plaçables n'est pas égal à 20.
+        :raises QuoridorError: si le total des murs placés et plaçables n'est pas égal à 20
+        (pour un damier de 9x9).
         :raises QuoridorError: si la position d'un mur est invalide.
         """
+        if not (isinstance(taille, int) and taille >= 3):
+            raise QuoridorError("La taille du damier est invalide")
+
         try:
             iter(joueurs)
         except TypeError:
@@ -161,26 +188,30 @@ class Quoridor:
             raise QuoridorError("Il doit uniquement y avoir 2 joueurs")
 
         nb_murs = 0
+        max_murs = nb_murs_par_joueur(taille)
+        self.taille = taille
         self.etat = {"joueurs": [], "murs": None}
         self.type_coup = ""
         self.pos_coup = None
+        self._ponts = None
 
         for i, joueur in enumerate(joueurs):
             if isinstance(joueur, dict):
-                if not (isinstance(joueur["murs"], int) and 0 <= joueur["murs"] <= 10):
-                    raise QuoridorError("Le nombre de murs qu'un joueur peut placer est >10, "
-                                        "négatif, ou invalide")
+                if not (isinstance(joueur["murs"], int) and 0 <= joueur["murs"] <= max_murs):
+                    raise QuoridorError(f"Le nombre de murs qu'un joueur peut placer est "
+                                        f">{max_murs}, négatif, ou invalide")
 
-                if not self.pos_joueur_valide(joueur["pos"]):
+                if not self.pos_joueur_valide(joueur["pos"], taille):
                     raise QuoridorError("La position d'un des joueurs est invalide")
 
                 nb_murs += joueur["murs"]
                 self.etat["joueurs"].append(deepcopy(joueur))
             else:
+                nb_murs += max_murs
                 self.etat["joueurs"].append({
                     "nom": joueur,
-                    "murs": 10,
-                    "pos": (5, 1 if i == 0 else 9)
+                    "murs": max_murs,
+                    "pos": ((taille + 1) // 2, 1 if i == 0 else taille)
                 })
 
         if murs is not None:
@@ -189,25 +220,20 @@ class Quoridor:
 
             murs_h, murs_v = murs["horizontaux"], murs["verticaux"]
 
-            self.valider_murs(murs_h, murs_v)
-
-            graphe = construire_graphe(
-                [joueur["pos"] for joueur in self.etat["joueurs"]],
-                murs_h,
-                murs_v
-            )
-
-            if any(not nx.has_path(graphe, tuple(joueur["pos"]), f'B{i+1}')
-                   for i, joueur in enumerate(joueurs)):
-                raise QuoridorError("Un des joueurs est emprisonné par des murs")
+            self.valider_murs(murs_h, murs_v, taille)
 
             nb_murs += len(murs_h) + len(murs_v)
 
-        if nb_murs != 20:
-            raise QuoridorError("Le total des murs placés et plaçables n'est pas égal à 20")
+        if nb_murs != 2 * max_murs:
+            raise QuoridorError(f"Le total des murs placés et plaçables n'est pas égal à "
+                                f"{2 * max_murs}")
 
         self.etat["murs"] = {"horizontaux": [], "verticaux": []} if murs is None else deepcopy(murs)
 
+        if any(not ponts.atteignable(tuple(joueur["pos"]))
+               for ponts, joueur in zip(self.index_ponts(), self.etat["joueurs"])):
+            raise QuoridorError("Un des joueurs est emprisonné par des murs")
+
     def __str__(self):
         """
         Produire la représentation en art ascii correspondant à l'état actuel de la partie.
@@ -215,17 +241,19 @@ class Quoridor:
 
         :returns: la chaîne de caractères de la représentation.
         """
-        patron_carres = list(" | .   .   .   .   .   .   .   .   . |")
-        patron_murs = list("  |                                   |")
+        largeur = len(str(self.taille))  # largeur des numéros de ligne
+        decalage = largeur - 1
+        patron_carres = list(" | " + "   ".join("." * self.taille) + " |")
+        patron_murs = list(" " * largeur + " |" + " " * (4 * self.taille - 1) + "|")
         plateau = []
 
         # génération du plateau vierge
-        num_ligne = 9
-        for i in range(17):
+        num_ligne = self.taille
+        for i in range(2 * self.taille - 1):
             if i % 2:
                 plateau.append([*patron_murs])  # shallow copy du patron
             else:
-                plateau.append([str(num_ligne)] + patron_carres)
+                plateau.append([*f"{num_ligne:>{largeur}}"] + patron_carres)
                 num_ligne -= 1
 
         id_joueurs = []
@@ -235,7 +263,7 @@ class Quoridor:
             id_joueur = str(i + 1)
             id_joueurs.append(f'{id_joueur}={joueur["nom"]}')
             ligne = -2 * joueur["pos"][1] + 1
-            colonne = 4 * joueur["pos"][0]
+            colonne = 4 * joueur["pos"][0] + decalage
             plateau[ligne][colonne] = id_joueur
 
         patron_mur_h = list("-------")
@@ -243,29 +271,30 @@ class Quoridor:
         # plaçage des murs horizontaux
         for mur_h in self.etat.get("murs")["horizontaux"]:
             ligne = -2 * mur_h[1] + 2
-            colonne = 4 * mur_h[0] - 1
+            colonne = 4 * mur_h[0] - 1 + decalage
             plateau[ligne][colonne: colonne + len(patron_mur_h)] = patron_mur_h
 
         # plaçage des murs verticaux
         for mur_v in self.etat.get("murs")["verticaux"]:
             ligne = -2 * mur_v[1] + 1
-            colonne = 4 * mur_v[0] - 2
+            colonne = 4 * mur_v[0] - 2 + decalage
             for i in range(ligne, ligne - 3, -1):
                 plateau[i][colonne] = "|"
 
         # concaténation des morceaux du plateau
         return "\n".join(["Légende: " + ", ".join(id_joueurs),
-                          "   -----------------------------------",
+                          " " * (largeur + 2) + "-" * (4 * self.taille - 1),
                           *["".join(ligne) for ligne in plateau],
-                          "--|-----------------------------------",
-                          "  | 1   2   3   4   5   6   7   8   9"])
+                          "-" * (largeur + 1) + "|" + "-" * (4 * self.taille - 1),
+                          " " * largeur + " | " + "".join(
+                              f"{i:<4}" for i in range(1, self.taille + 1)).rstrip()])
 
     def déplacer_jeton(self, joueur, position):
         """
         Pour le joueur spécifié, déplacer son jeton à la position spécifiée.
 
         :param joueur: un entier spécifiant le numéro du joueur (1 ou 2).
-        :param position: le tuple (x, y) de la position du jeton (1<=x<=9 et 1<=y<=9).
+        :param position: le tuple (x, y) de la position du jeton (1<=x<=taille et 1<=y<=taille).
         :raises QuoridorError: si le numéro du joueur est autre que 1 ou 2.
         :raises QuoridorError: si la position est invalide (en dehors du damier).
         :raises QuoridorError: si la position est invalide pour l'état actuel du jeu.
@@ -273,13 +302,14 @@ class Quoridor:
         if joueur not in (1, 2):
             raise QuoridorError("Le numéro du joueur est invalide")
 
-        if not self.pos_joueur_valide(position):
+        if not self.pos_joueur_valide(position, self.taille):
             raise QuoridorError("La position est invalide (en dehors du damier)")
 
         graphe = construire_graphe(
             [joueur["pos"] for joueur in self.etat["joueurs"]],
             self.etat.get("murs")["horizontaux"],
-            self.etat.get("murs")["verticaux"]
+            self.etat.get("murs")["verticaux"],
+            self.taille
         )
 
         dict_joueur = self.etat.get("joueurs")[int(joueur)-1]
@@ -308,7 +338,7 @@ class Quoridor:
         où la clé 'nom' d'un joueur est associée à son nom, la clé 'murs' est associée
         au nombre de murs qu'il peut encore placer sur ce damier, et la clé 'pos' est
         associée à sa position sur le damier. Une position est représentée par un tuple
-        de deux coordonnées x et y, où 1<=x<=9 et 1<=y<=9.
+        de deux coordonnées x et y, où 1<=x<=taille et 1<=y<=taille (9 par défaut).
 
         Les murs actuellement placés sur le damier sont énumérés dans deux listes de
         positions (x, y). Les murs ont toujours une longueur de 2 cases et leur position
@@ -320,13 +350,18 @@ class Quoridor:
         """
         return deepcopy(self.etat)
 
-    def jouer_coup(self, joueur):
+    def jouer_coup(self, joueur, profondeur=0, nb_processus=None, duree=None):
         """
         Pour le joueur spécifié, jouer automatiquement son meilleur coup pour l'état actuel
         de la partie. Ce coup est soit le déplacement de son jeton, soit le placement d'un
         mur horizontal ou vertical.
 
         :param joueur: un entier spécifiant le numéro du joueur (1 ou 2).
+        :param profondeur: la profondeur de la recherche alpha-bêta (module moteur), en
+        demi-coups; 0 pour le jeu glouton.
+        :param nb_processus: le nombre de processus de la recherche (par défaut, le nombre
+        de coeurs).
+        :param duree: le temps alloué à la recherche en secondes, ou None pour aucune limite.
         :raises QuoridorError: si le numéro du joueur est autre que 1 ou 2.
         :raises QuoridorError: si la partie est déjà terminée.
         """
@@ -336,6 +371,20 @@ class Quoridor:
         if joueur not in (1, 2):
             raise QuoridorError("Le numéro du joueur est invalide")
 
+        if profondeur > 0:
+            # import à la demande: multiprocessing n'est chargé que pour la recherche
+            from moteur import choisir_coup  # pylint: disable=import-outside-toplevel
+
+            type_coup, position = choisir_coup(self, joueur, profondeur, nb_processus, duree)
+            if type_coup == "D":
+                self.déplacer_jeton(joueur, position)
+            else:
+                self.placer_mur(joueur, position,
+                                "horizontal" if type_coup == "MH" else "vertical")
+            self.type_coup = type_coup
+            self.pos_coup = position
+            return
+
         # joueur = int(joueur)
         adversaire = 1 if joueur == 2 else 2
 
@@ -345,56 +394,80 @@ class Quoridor:
         graphe = construire_graphe(
             [pos_joueur, pos_adversaire],
             self.etat.get("murs")["horizontaux"],
-            self.etat.get("murs")["verticaux"]
+            self.etat.get("murs")["verticaux"],
+            self.taille
         )
 
-        chemin_joueur = nx.shortest_path(graphe, pos_joueur, f'B{joueur}')
-        chemin_adversaire = nx.shortest_path(graphe, pos_adversaire, f'B{adversaire}')
-        deplacer_joueur = False
-
-        if len(chemin_joueur) <= len(chemin_adversaire) or \
-                len(graphe.successors(pos_adversaire)) < 2:
-            deplacer_joueur = True
-        else:
-            prochaine_pos_adversaire = chemin_adversaire[1]
-            diff_x = prochaine_pos_adversaire[0] - pos_adversaire[0]
-            diff_y = prochaine_pos_adversaire[1] - pos_adversaire[1]
-
-            if diff_x != 0:  # tentative plaçage mur vertical
-                mur_v = [prochaine_pos_adversaire[0] - min(diff_x, 0), prochaine_pos_adversaire[1]]
-                try:
-                    self.placer_mur(joueur, tuple(mur_v), "vertical")
-                    self.type_coup = "MV"
-                    self.pos_coup = tuple(mur_v)
-                except QuoridorError:
-                    mur_v[1] -= 1  # tentative plaçage mur vertical plus bas
-                    try:
-                        self.placer_mur(joueur, tuple(mur_v), "vertical")
-                        self.type_coup = "MV"
-                        self.pos_coup = tuple(mur_v)
-                    except QuoridorError:
-                        deplacer_joueur = True
-
-            else:  # tentative plaçage mur horizontal
-                mur_h = [prochaine_pos_adversaire[0], prochaine_pos_adversaire[1] - min(diff_y, 0)]
-                try:
-                    self.placer_mur(joueur, tuple(mur_h), "horizontal")
-                    self.type_coup = "MH"
-                    self.pos_coup = tuple(mur_h)
-                except QuoridorError:
-                    mur_h[0] -= 1  # tentative plaçage mur horizontal plus à gauche
-                    try:
-                        self.placer_mur(joueur, tuple(mur_h), "horizontal")
-                        self.type_coup = "MH"
-                        self.pos_coup = tuple(mur_h)
-                    except QuoridorError:
-                        deplacer_joueur = True
+        chemin_joueur = plus_court_chemin(graphe, pos_joueur, f'B{joueur}')
+        chemin_adversaire = plus_court_chemin(graphe, pos_adversaire, f'B{adversaire}')
+        deplacer_joueur = True
+
+        if len(chemin_joueur) > len(chemin_adversaire) and \
+                len(graphe.successors(pos_adversaire)) >= 2 and \
+                self.etat.get("joueurs")[joueur-1]["murs"] > 0:
+            # placer le mur qui allonge le plus le chemin de l'adversaire par rapport au nôtre
+            for gain, orientation, position in self.murs_candidats(joueur, 1):
+                if gain > 0:
+                    self.placer_mur(joueur, position, orientation)
+                    self.type_coup = "MH" if orientation == "horizontal" else "MV"
+                    self.pos_coup = position
+                    deplacer_joueur = False
 
         if deplacer_joueur:
             self.déplacer_jeton(joueur, chemin_joueur[1])
             self.type_coup = "D"
             self.pos_coup = chemin_joueur[1]
 
+    def index_ponts(self):
+        """
+        Produire l'index des arêtes critiques du damier pour chacun des joueurs.
+        L'index ne dépend que des murs: il est reconstruit seulement lorsqu'ils changent.
+
+        :returns: un tuple (index du joueur 1, index du joueur 2) d'objets IndexPonts.
+        """
+        if self._ponts is None:
+            cases = construire_cases(self.etat.get("murs")["horizontaux"],
+                                     self.etat.get("murs")["verticaux"],
+                                     self.taille)
+            self._ponts = (IndexPonts(cases, self.taille), IndexPonts(cases, 1))
+        return self._ponts
+
+    def mur_emprisonne(self, position, orientation):
+        """
+        Déterminer si un mur à la position spécifiée emprisonnerait un des joueurs, à l'aide
+        de l'index des arêtes critiques (sans reconstruire le graphe).
+        Les chevauchements avec les murs existants ne sont pas vérifiés ici.
+
+        :param position: le tuple (x, y) de la position du mur.
+        :param orientation: l'orientation du mur ('horizontal' ou 'vertical').
+        :returns: True si un des joueurs n'atteindrait plus sa rangée but.
+        """
+        aretes = aretes_mur(tuple(position), orientation)
+        return any(ponts.coupe(tuple(joueur["pos"]), aretes)
+                   for ponts, joueur in zip(self.index_ponts(), self.etat["joueurs"]))
+
+    def murs_candidats(self, joueur, k=10):
+        """
+        Pour le joueur spécifié, classer les murs qu'il peut placer selon le gain en longueur
+        de chemin, c.-à-d. l'allongement du plus court chemin de l'adversaire moins celui du
+        sien. Les DAG des plus courts chemins des deux joueurs sont construits une seule fois
+        et chaque emplacement libre est évalué à partir du flux de chemins qu'il coupe.
+        Les pions sont ignorés (pas de sauts) et le nombre de murs restants n'est pas vérifié.
+
+        :param joueur: un entier spécifiant le numéro du joueur (1 ou 2).
+        :param k: le nombre maximal de murs retournés.
+        :returns: une liste d'au plus k tuples (gain, orientation, (x, y)), du meilleur au pire.
+        :raises QuoridorError: si le numéro du joueur est autre que 1 ou 2.
+        """
+        if joueur not in (1, 2):
+            raise QuoridorError("Le numéro du joueur est invalide")
+
+        return classer_murs(self.index_ponts(),
+                            [joueur["pos"] for joueur in self.etat["joueurs"]],
+                            self.etat["murs"]["horizontaux"],
+                            self.etat["murs"]["verticaux"],
+                            joueur, k)
+
     def partie_terminée(self):
         """
         Déterminer si la partie est terminée.
@@ -404,7 +477,7 @@ class Quoridor:
         joueur_1 = self.etat["joueurs"][0]
         joueur_2 = self.etat["joueurs"][1]
 
-        if joueur_1.get("pos")[1] == 9:
+        if joueur_1.get("pos")[1] == self.taille:
             return joueur_1["nom"]
         if joueur_2.get("pos")[1] == 1:
             return joueur_2["nom"]
@@ -432,31 +505,25 @@ class Quoridor:
             raise QuoridorError("Aucun mur restant pour ce joueur")
 
         if orientation == "horizontal":
-            if not self.pos_mur_h_valide(position):
+            if not self.pos_mur_h_valide(position, self.taille):
                 raise QuoridorError("La position de ce mur horizontal est invalide")
             murs_h = [position] + self.etat.get("murs")["horizontaux"]
             murs_v = self.etat.get("murs")["verticaux"]
         else:
-            if not self.pos_mur_v_valide(position):
+            if not self.pos_mur_v_valide(position, self.taille):
                 raise QuoridorError("La position de ce mur vertical est invalide")
             murs_h = self.etat.get("murs")["horizontaux"]
             murs_v = [position] + self.etat.get("murs")["verticaux"]
 
-        self.valider_murs(murs_h, murs_v)
-
-        pos_joueurs = [joueur["pos"] for joueur in self.etat["joueurs"]]
+        self.valider_murs(murs_h, murs_v, self.taille)
 
-        graphe = construire_graphe(
-            pos_joueurs,
-            murs_h,
-            murs_v
-        )
-
-        if any(not nx.has_path(graphe, tuple(pos_joueur), f'B{i+1}')
-               for i, pos_joueur in enumerate(pos_joueurs)):
+        if self.mur_emprisonne(position, orientation):
             raise QuoridorError("Un des joueurs serait emprisonné par ce mur")
 
         if orientation == "horizontal":
             self.etat.get("murs")["horizontaux"].append(position)
         else:
             self.etat.get("murs")["verticaux"].append(position)
+
+        self.etat.get("joueurs")[int(joueur)-1]["murs"] -= 1
+        self._ponts = None  # les murs ont changé
@@ -8,9 +8,6 @@ class QuoridorX(Quoridor):
     """Classe QuoridorX"""
     TAILLE_CASE = 30
     MARGE_CASE = 20
-    NB_RANGEES = 9
-    XY_OFFSET = - (TAILLE_CASE * NB_RANGEES + MARGE_CASE * (NB_RANGEES - 1)) / 2 \
-                - TAILLE_CASE - MARGE_CASE
     XY_INCR = TAILLE_CASE + MARGE_CASE
     TAILLE_POLICE = 18
     LONGUEUR_MUR = TAILLE_CASE * 2.4 + MARGE_CASE
@@ -23,6 +20,17 @@ class QuoridorX(Quoridor):
         super().__init__(*args, **kwargs)
         self.afficher()
 
+    @property
+    def NB_RANGEES(self):  # pylint: disable=invalid-name
+        """Nombre de rangées du damier affiché"""
+        return self.taille
+
+    @property
+    def XY_OFFSET(self):  # pylint: disable=invalid-name
+        """Décalage qui centre le damier dans la fenêtre"""
+        return - (self.TAILLE_CASE * self.NB_RANGEES + self.MARGE_CASE * (self.NB_RANGEES - 1)) \
+            / 2 - self.TAILLE_CASE - self.MARGE_CASE
+
     def _pos_damier(self, num_case):
         return num_case * self.XY_INCR + self.XY_OFFSET
 
@@ -106,7 +114,8 @@ class QuoridorX(Quoridor):
         # dessin légende
 
         id_joueurs = [f'{i+1}={joueur["nom"]}' for i, joueur in enumerate(self.etat["joueurs"])]
-        turtle.setpos(self._pos_damier(1), self._pos_damier(10) - self.MARGE_CASE/2)
+        turtle.setpos(self._pos_damier(1),
+                      self._pos_damier(self.NB_RANGEES + 1) - self.MARGE_CASE/2)
         turtle.write("Légende: " + ", ".join(id_joueurs), font=("", 14))
 
         # plaçage des pions